@@ -0,0 +1,6 @@
+"""Allow running DocIndexer with `python -m docindexer`."""
+
+from .entry import run
+
+if __name__ == '__main__':
+    run()
@@ -1,37 +1,41 @@
 #!/usr/bin/env python3
 """Command line interface for DocIndexer with schema validation and configuration management."""
 
-import sys
-import json
-import click
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.markdown import Markdown
-from rich.tree import Tree
-from rich.progress import Progress
+import importlib
 from pathlib import Path
-import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping
+
+import click
 
-from .indexer import DocIndexer
-from .validator import SchemaValidator, ValidationError
-from .config import Configuration
-from .file_iterator import FileIterator, FileInfo
-from .list_command import setup_list_command
-from .index_command import setup_index_command
-from .schema_command import setup_schema_command
-from .config_command import setup_config_command
-from .structure_command import setup_structure_command
+from .entry import display_readme
+from .validator import SchemaValidator
+from .config import Configuration, configure_logging
 
-# Initialize console for rich output
-console = Console()
+# CLI schema shipped with the package, resolved once at import
+_SCHEMA_PATH = Path(__file__).parent / "cli_schema.json"
+
+class SchemaValidationError(click.UsageError):
+    """Usage error for arguments rejected by the CLI schema.
+    
+    The individual error messages are kept as a list and only joined into
+    the displayed message when it is formatted.
+    """
+    
+    def __init__(self, errors: List[str]):
+        super().__init__("Validation failed")
+        self.errors = errors
+    
+    def format_message(self) -> str:
+        return "Validation failed:\n" + "\n".join(self.errors)
+    
+    def __str__(self) -> str:
+        return self.format_message()
 
 # Create configuration and validator instances
 config_manager = Configuration()
-validator = SchemaValidator(Path(__file__).parent / "cli_schema.json")
+validator = SchemaValidator(_SCHEMA_PATH)
 
-def validate_and_apply_config(command: str, args: Dict[str, Any]) -> Dict[str, Any]:
+def validate_and_apply_config(command: str, args: Dict[str, Any]) -> Mapping[str, Any]:
     """Validate arguments against schema and apply configuration.
     
     Args:
@@ -39,48 +43,66 @@ def validate_and_apply_config(command: str, args: Dict[str, Any]) -> Dict[str, A
         args: The command arguments
         
     Returns:
-        Dict containing validated and merged configuration
+        Read-only mapping of the validated and merged configuration
         
     Raises:
-        click.UsageError: If validation fails
+        SchemaValidationError: If validation fails
     """
-    # Normalize argument names
-    normalized_args = validator.normalize_args(args)
-    
     # Load configuration from files
     config_manager.load_config()
     
-    # Apply defaults from schema
-    args_with_defaults = validator.apply_defaults(normalized_args, command)
-    
-    # Validate the command arguments
-    is_valid, errors = validator.validate_command(command, args_with_defaults)
-    if not is_valid:
-        error_msg = "\n".join(errors)
-        raise click.UsageError(f"Validation failed:\n{error_msg}")
+    # Normalize argument names, apply defaults from schema and validate
+    args_with_defaults, errors = validator.prepare(command, args)
+    if errors:
+        raise SchemaValidationError(errors)
     
     # Update configuration with command-line arguments
     config_manager.set_cli_args(args_with_defaults)
     
     return config_manager.as_dict()
 
-def display_readme():
-    """Display the README file and exit."""
-    try:
-        readme_path = Path.cwd() / "README.md"
-        with open(readme_path, 'r') as f:
-            console.print(Panel(Markdown(f.read()), title="README", border_style="blue"))
-        sys.exit(0)
-    except FileNotFoundError:
-        console.print("[bold red]README.md not found![/]")
-        sys.exit(1)
+class LazyCommandGroup(click.Group):
+    """Click group that imports and registers each subcommand on first lookup.
+    
+    Commands are described by name as (module, setup function, setup args);
+    the module is imported and its setup function called with the group when
+    Click first asks for the command, so only the invoked command's module
+    (and its dependencies) is loaded.
+    """
+    
+    def __init__(self, *args, lazy_commands: Dict[str, tuple] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+    
+    def list_commands(self, ctx):
+        return sorted(self.commands.keys() | self.lazy_commands.keys())
+    
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, setup_name, setup_args = self.lazy_commands[cmd_name]
+            module = importlib.import_module(module_name, __package__)
+            getattr(module, setup_name)(self, *setup_args)
+        return super().get_command(ctx, cmd_name)
 
-@click.group(invoke_without_command=True)
+# Commands defined in separate modules: name -> (module, setup function,
+# shared objects the setup function expects after the main group)
+_COMMAND_SETUPS = {
+    'index': ('.index_command', 'setup_index_command', (validate_and_apply_config, config_manager)),
+    'list': ('.list_command', 'setup_list_command', (validate_and_apply_config, config_manager)),
+    'schema': ('.schema_command', 'setup_schema_command', (validator,)),
+    'config': ('.config_command', 'setup_config_command', (config_manager, validate_and_apply_config)),
+    'structure': ('.structure_command', 'setup_structure_command', (validate_and_apply_config, config_manager)),
+}
+
+@click.group(cls=LazyCommandGroup, lazy_commands=_COMMAND_SETUPS, invoke_without_command=True)
 @click.version_option()
 @click.option('--readme', is_flag=True, help='Display README and exit')
 @click.pass_context
 def main(ctx, readme):
     """DocIndexer - A command line tool for indexing documents."""
+    # Logging is set up when the CLI runs, not when this module is imported
+    configure_logging()
+    
     # If --readme is specified, display README and exit
     if readme:
         display_readme()
@@ -90,23 +112,5 @@ def main(ctx, readme):
         click.echo(ctx.get_help())
         ctx.exit(0)
 
-# Command will be set up after main group is defined
-
-# Command will be set up after main group is defined
-
-# Command will be set up after main group is defined
-
-# Command will be set up after main group is defined
-
-
-# Command will be set up after main group is defined
-
-# Set up commands that were defined in separate modules
-setup_index_command(main, validate_and_apply_config, config_manager)
-setup_list_command(main, validate_and_apply_config, config_manager)
-setup_schema_command(main, validator)
-setup_config_command(main, config_manager, validate_and_apply_config)
-setup_structure_command(main, validate_and_apply_config, config_manager)
-
 if __name__ == '__main__':
     main()
\ No newline at end of file
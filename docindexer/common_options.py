@@ -0,0 +1,31 @@
+"""Click options shared by the file-processing commands of the DocIndexer CLI."""
+
+import click
+
+# Option declarations shared verbatim by every command that discovers files,
+# in the order they should appear in --help.
+_COMMON_OPTION_SPECS = (
+    (('--source-folder', '-s'), {'help': 'Path to the folder containing files to be processed'}),
+    (('--catalogue', '-c'), {'help': 'Path to a catalogue JSON file'}),
+    (('--file-name', '-n'), {'help': 'the name of the file to be processed'}),
+)
+
+# Decorators are built once at import and applied innermost-first, which is
+# the reverse of their --help order.
+_COMMON_OPTION_DECORATORS = tuple(
+    click.option(*param_decls, **attrs) for param_decls, attrs in reversed(_COMMON_OPTION_SPECS)
+)
+
+
+def common_options(func):
+    """Attach the shared file discovery options to a Click command function.
+
+    Args:
+        func: Command callback to decorate
+
+    Returns:
+        The decorated callback
+    """
+    for decorator in _COMMON_OPTION_DECORATORS:
+        func = decorator(func)
+    return func
@@ -2,17 +2,77 @@
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from types import MappingProxyType
+from typing import Any, Dict, KeysView, Mapping
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+from . import json_utils
+
 logger = logging.getLogger(__name__)
 
+# Format used for DocIndexer log records
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Marks a missing key in single-lookup reads
+_MISSING = object()
+
+# Local configuration lives in the current working directory
+_LOCAL_CONFIG_PATH = Path("./config.json")
+
+
+@lru_cache(maxsize=8)
+def _read_config_file(path: str, inode: int, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a configuration file, memoized on its path and stat signature.
+    
+    The stat fields are part of the cache key so that an edited or replaced
+    file is re-parsed instead of served stale (the inode also tells apart the
+    ./config.json of different working directories). The returned dictionary
+    is shared between callers and must not be mutated.
+    """
+    return json_utils.loads(Path(path).read_bytes())
+
+
+def _write_config_file(path: Path, payload: bytes) -> None:
+    """Write a configuration file through a raw file descriptor.
+    
+    The pre-serialized payload normally goes out in a single write() call
+    without Python's buffered I/O layer. Newly created files are readable and
+    writable by their owner only.
+    
+    Args:
+        path: File to create or overwrite
+        payload: Serialized configuration
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o600)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=1)
+def _global_config_path() -> Path:
+    """Resolve the global configuration path (~/.docindexer/config.json) once."""
+    return Path.home() / ".docindexer" / "config.json"
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """Configure root logging for the DocIndexer command line.
+    
+    Library modules only create their loggers; handlers are installed here,
+    by the CLI entry point, so importing the package has no logging side
+    effects.
+    
+    Args:
+        level: Minimum level of records to emit
+    """
+    logging.basicConfig(level=level, format=_LOG_FORMAT)
+
 
 class Configuration:
     """Configuration class for DocIndexer.
@@ -23,42 +83,68 @@ class Configuration:
     3. Global configuration file (~/.docindexer/config.json)
     """
     
+    # A CLI process holds one instance, but attribute access is on every
+    # configuration read, so instances use slots rather than a __dict__
+    __slots__ = (
+        '_local_config_path', '_global_config_path',
+        '_global_config', '_local_config', '_cli_args',
+        '_config', '_dirty',
+    )
+    
     def __init__(self):
         """Initialize a new Configuration instance."""
-        self._local_config_path = Path("./config.json")
-        self._global_config_path = Path.home() / ".docindexer" / "config.json"
+        self._local_config_path = _LOCAL_CONFIG_PATH
+        self._global_config_path = _global_config_path()
         
         # Configuration values from different sources
         self._global_config: Dict[str, Any] = {}
         self._local_config: Dict[str, Any] = {}
         self._cli_args: Dict[str, Any] = {}
         
-        # Merged configuration (with command-line taking precedence)
-        self._config: Dict[str, Any] = {}
+        # Read-only merged configuration (command-line taking precedence)
+        self._config: Mapping[str, Any] = MappingProxyType({})
+        
+        # Set when a source dictionary is replaced; readers rebuild the
+        # merged configuration on their next access
+        self._dirty = False
         
     def load_global_config(self) -> None:
         """Load configuration from the global config file."""
-        if self._global_config_path.exists():
-            try:
-                with open(self._global_config_path, 'r') as f:
-                    self._global_config = json.load(f)
-                logger.debug(f"Loaded global config from {self._global_config_path}")
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to parse global config file at {self._global_config_path}")
-            except Exception as e:
-                logger.warning(f"Error loading global config: {str(e)}")
+        # A missing file is the common case and surfaces as an OSError from
+        # stat() or the read, so no separate exists() check is needed
+        try:
+            st = self._global_config_path.stat()
+            self._global_config = _read_config_file(
+                str(self._global_config_path), st.st_ino, st.st_mtime_ns, st.st_size
+            )
+            self._dirty = True
+            logger.debug(f"Loaded global config from {self._global_config_path}")
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            # No config file at that path
+            pass
+        except json.JSONDecodeError:
+            logger.warning(f"Failed to parse global config file at {self._global_config_path}")
+        except Exception as e:
+            logger.warning(f"Error loading global config: {str(e)}")
     
     def load_local_config(self) -> None:
         """Load configuration from the local config file."""
-        if self._local_config_path.exists():
-            try:
-                with open(self._local_config_path, 'r') as f:
-                    self._local_config = json.load(f)
-                logger.debug(f"Loaded local config from {self._local_config_path}")
-            except json.JSONDecodeError:
-                logger.warning(f"Failed to parse local config file at {self._local_config_path}")
-            except Exception as e:
-                logger.warning(f"Error loading local config: {str(e)}")
+        # A missing file is the common case and surfaces as an OSError from
+        # stat() or the read, so no separate exists() check is needed
+        try:
+            st = self._local_config_path.stat()
+            self._local_config = _read_config_file(
+                str(self._local_config_path), st.st_ino, st.st_mtime_ns, st.st_size
+            )
+            self._dirty = True
+            logger.debug(f"Loaded local config from {self._local_config_path}")
+        except (FileNotFoundError, NotADirectoryError, IsADirectoryError):
+            # No config file at that path
+            pass
+        except json.JSONDecodeError:
+            logger.warning(f"Failed to parse local config file at {self._local_config_path}")
+        except Exception as e:
+            logger.warning(f"Error loading local config: {str(e)}")
     
     def set_cli_args(self, args: Dict[str, Any]) -> None:
         """Set command-line arguments in the configuration.
@@ -67,20 +153,19 @@ class Configuration:
             args: Dictionary of command-line arguments
         """
         self._cli_args = {k: v for k, v in args.items() if v is not None}
-        self._update_merged_config()
+        self._dirty = True
     
     def _update_merged_config(self) -> None:
-        """Update the merged configuration with values from all sources."""
-        # Start with global config (lowest priority)
-        self._config = self._global_config.copy()
+        """Update the merged configuration with values from all sources.
         
-        # Add local config (overrides global)
-        for key, value in self._local_config.items():
-            self._config[key] = value
-        
-        # Add CLI args (highest priority)
-        for key, value in self._cli_args.items():
-            self._config[key] = value
+        The sources are flattened into one dictionary (CLI args over local
+        config over global config) so that every read is a single lookup. It
+        only needs rebuilding when one of the source dictionaries is
+        replaced, and that is deferred until the configuration is next read.
+        """
+        # Dict unpacking merges in C; later sources take precedence
+        self._config = MappingProxyType({**self._global_config, **self._local_config, **self._cli_args})
+        self._dirty = False
     
     def create_local_config(self) -> bool:
         """Create a local configuration file with the current effective configuration.
@@ -89,8 +174,7 @@ class Configuration:
             True if the configuration file was created successfully
         """
         try:
-            with open(self._local_config_path, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            _write_config_file(self._local_config_path, json_utils.dumps_bytes(self.as_dict(), indent=True))
             logger.info(f"Created local config file at {self._local_config_path}")
             return True
         except Exception as e:
@@ -104,11 +188,13 @@ class Configuration:
             True if the configuration file was created successfully
         """
         try:
-            # Ensure the directory exists
-            self._global_config_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self._global_config_path, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            payload = json_utils.dumps_bytes(self.as_dict(), indent=True)
+            try:
+                _write_config_file(self._global_config_path, payload)
+            except FileNotFoundError:
+                # Only create ~/.docindexer when the first write shows it is missing
+                self._global_config_path.parent.mkdir(parents=True, exist_ok=True)
+                _write_config_file(self._global_config_path, payload)
             logger.info(f"Created global config file at {self._global_config_path}")
             return True
         except Exception as e:
@@ -125,6 +211,8 @@ class Configuration:
         Returns:
             Configuration value for the key
         """
+        if self._dirty:
+            self._update_merged_config()
         return self._config.get(key, default)
     
     def __getitem__(self, key: str) -> Any:
@@ -139,9 +227,12 @@ class Configuration:
         Raises:
             KeyError: If the key is not found in the configuration
         """
-        if key in self._config:
-            return self._config[key]
-        raise KeyError(f"Configuration key '{key}' not found")
+        if self._dirty:
+            self._update_merged_config()
+        value = self._config.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(f"Configuration key '{key}' not found")
+        return value
     
     def __contains__(self, key: str) -> bool:
         """Check if a key exists in the configuration.
@@ -152,26 +243,33 @@ class Configuration:
         Returns:
             True if the key exists in the configuration
         """
+        if self._dirty:
+            self._update_merged_config()
         return key in self._config
     
-    def keys(self) -> Set[str]:
+    def keys(self) -> KeysView[str]:
         """Get all configuration keys.
         
         Returns:
-            Set of all configuration keys
+            Read-only, set-like view of all configuration keys (no copy is made)
         """
-        return set(self._config.keys())
+        return self.as_dict().keys()
     
-    def as_dict(self) -> Dict[str, Any]:
+    def as_dict(self) -> Mapping[str, Any]:
         """Get the effective configuration as a dictionary.
         
         Returns:
-            Dictionary containing all configuration values
+            Read-only mapping of all configuration values, shared between
+            calls until the configuration changes (use dict() for a copy)
         """
-        return self._config.copy()
+        if self._dirty:
+            self._update_merged_config()
+        return self._config
         
     def load_config(self) -> None:
-        """Load configuration from all available sources and update the merged config."""
+        """Load configuration from all available sources.
+        
+        The merged configuration reflects the reloaded sources on its next read.
+        """
         self.load_global_config()
-        self.load_local_config()
-        self._update_merged_config()
\ No newline at end of file
+        self.load_local_config()
\ No newline at end of file
@@ -1,15 +1,58 @@
 #!/usr/bin/env python3
 """Implementation of the config command for DocIndexer CLI."""
 
-import json
 import click
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+
+from . import json_utils
+from .common_options import common_options
 
 # Initialize console for rich output
 console = Console()
 
+# Values accepted by --source, and which of them display each configuration
+_CONFIG_SOURCES = ('all', 'global', 'local', 'effective')
+_SHOW_GLOBAL = frozenset({'all', 'global'})
+_SHOW_LOCAL = frozenset({'all', 'local'})
+_SHOW_EFFECTIVE = frozenset({'all', 'effective'})
+
+# File discovery/filtering options passed on only when given on the command
+# line, as (callback parameter, configuration key, is_flag). Flags count as
+# given when set, other options when not None.
+_FILTER_OPTIONS = (
+    ('source_folder', 'source_folder', False),
+    ('catalogue', 'catalogue', False),
+    ('file_name', 'file_name', False),
+    ('pattern', 'pattern', False),
+    ('regex', 'use_regex', True),
+    ('sort_by', 'sort_by', False),
+    ('desc', 'sort_desc', True),
+    ('max_depth', 'max_depth', False),
+    ('recursive', 'recursive', False),
+    ('limit', 'limit', False),
+    ('random', 'random', True),
+    ('output_folder', 'output_folder', False),
+    ('include_hidden', 'include_hidden', True),
+    ('omit_properties', 'omit_properties', False),
+)
+
+def _json_renderable(text):
+    """Prepare serialized JSON for display inside a panel.
+    
+    The JSON is never parsed as Rich markup, and syntax highlighting is only
+    applied when writing to a terminal (styles are discarded otherwise).
+    
+    Args:
+        text: Serialized configuration data
+        
+    Returns:
+        Renderable text for the JSON
+    """
+    if console.is_terminal:
+        return console.render_str(text, markup=False)
+    from rich.text import Text
+    return Text(text)
+
 def execute_config_command(config_manager, args, validate_and_apply_config):
     """Execute the config command.
     
@@ -21,6 +64,8 @@ def execute_config_command(config_manager, args, validate_and_apply_config):
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    from rich.panel import Panel
+
     # Extract specific config options
     source = args.get('source', 'effective')
     create_local = args.get('create_local', False)
@@ -28,6 +73,18 @@ def execute_config_command(config_manager, args, validate_and_apply_config):
     show = args.get('show', False)
     debug = args.get('debug', False)
     
+    # Serialized JSON per displayed mapping and indent; --debug and the
+    # effective panel show the same (cached) effective configuration
+    serialized = {}
+    
+    def to_json(data, indent=True):
+        key = (id(data), indent)
+        entry = serialized.get(key)
+        if entry is None:
+            # Keep a reference to data so its id cannot be reused meanwhile
+            entry = serialized[key] = (data, json_utils.dumps(data, indent=indent))
+        return entry[1]
+    
     try:
         # Validate and apply all provided options to configuration
         # This ensures all file filtering options are captured
@@ -36,7 +93,10 @@ def execute_config_command(config_manager, args, validate_and_apply_config):
         # Show debug information if requested
         if debug:
             console.print("\n[bold blue]Configuration to be saved:[/]")
-            console.print(json.dumps(effective_config, indent=2))
+            if console.is_terminal:
+                console.print(to_json(effective_config))
+            else:
+                console.out(to_json(effective_config, indent=False), highlight=False)
         
         # Handle configuration creation if requested
         config_created = False
@@ -51,34 +111,37 @@ def execute_config_command(config_manager, args, validate_and_apply_config):
             config_created = True
             console.print("[bold green]✓[/] Created global configuration file with all provided options")
     
-        # Handle display options
-        if source in ['all', 'global']:
-            config_manager.load_global_config()
+        # Handle display options. validate_and_apply_config has already loaded
+        # both files; only a file written above needs reading again.
+        if source in _SHOW_GLOBAL:
+            if create_global:
+                config_manager.load_global_config()
             if config_manager._global_config:
                 console.print(Panel(
-                    json.dumps(config_manager._global_config, indent=2),
+                    _json_renderable(to_json(config_manager._global_config)),
                     title="Global Configuration (~/.docindexer/config.json)",
                     border_style="blue"
                 ))
             else:
                 console.print("[yellow]No global configuration found[/]")
         
-        if source in ['all', 'local']:
-            config_manager.load_local_config()
+        if source in _SHOW_LOCAL:
+            if create_local:
+                config_manager.load_local_config()
             if config_manager._local_config:
                 console.print(Panel(
-                    json.dumps(config_manager._local_config, indent=2),
+                    _json_renderable(to_json(config_manager._local_config)),
                     title="Local Configuration (./config.json)",
                     border_style="green"
                 ))
             else:
                 console.print("[yellow]No local configuration found[/]")
         
-        if source in ['all', 'effective'] or show:
+        if source in _SHOW_EFFECTIVE or show:
             effective_config = config_manager.as_dict()
             if effective_config:
                 console.print(Panel(
-                    json.dumps(effective_config, indent=2),
+                    _json_renderable(to_json(effective_config)),
                     title="Effective Configuration",
                     border_style="yellow"
                 ))
@@ -103,7 +166,7 @@ def setup_config_command(main_group, config_manager, validate_and_apply_config=N
     """
     @main_group.command()
     # Config-specific options
-    @click.option('--source', type=click.Choice(['all', 'global', 'local', 'effective']), 
+    @click.option('--source', type=click.Choice(_CONFIG_SOURCES), 
                 default='effective', help='Which configuration source to display')
     @click.option('--create-local', is_flag=True, 
                 help='Create a local config.json file with current settings')
@@ -113,9 +176,7 @@ def setup_config_command(main_group, config_manager, validate_and_apply_config=N
                 help='Show effective configuration and exit')
     
     # Common options for file discovery
-    @click.option('--source-folder', '-s', help='Path to the folder containing files to be processed')
-    @click.option('--catalogue', '-c', help='Path to a catalogue JSON file')
-    @click.option('--file-name', '-n', help='the name of the file to be processed')
+    @common_options
     
     # Common file filtering options
     @click.option('--pattern', '-p', help='Pattern to match file names (glob pattern by default)')
@@ -134,9 +195,7 @@ def setup_config_command(main_group, config_manager, validate_and_apply_config=N
     @click.option('--include-hidden', is_flag=True, help='Include hidden files and directories (starting with .)')
     @click.option('--omit-properties', help='Properties to omit from processing (for commands that support it)')
     @click.pass_context
-    def config(ctx, source, create_local, create_global, show, source_folder, catalogue, file_name,
-              pattern, regex, sort_by, desc, max_depth, recursive, limit, random, output_folder, 
-              debug, include_hidden, omit_properties):
+    def config(ctx, source, create_local, create_global, show, debug, **filter_options):
         """Display and manage configuration settings."""
         # Create dictionary of all parameters
         command_args = {
@@ -149,35 +208,12 @@ def setup_config_command(main_group, config_manager, validate_and_apply_config=N
         }
         
         # Add file filtering options only if they were specified
-        if source_folder is not None:
-            command_args['source_folder'] = source_folder
-        if catalogue is not None:
-            command_args['catalogue'] = catalogue
-        if file_name is not None:
-            command_args['file_name'] = file_name
-        if pattern is not None:
-            command_args['pattern'] = pattern
-        if regex:
-            command_args['use_regex'] = regex
-        if sort_by is not None:
-            command_args['sort_by'] = sort_by
-        if desc:
-            command_args['sort_desc'] = desc
-        if max_depth is not None:
-            command_args['max_depth'] = max_depth
-        if recursive is not None:
-            command_args['recursive'] = recursive
-        if limit is not None:
-            command_args['limit'] = limit
-        if random:
-            command_args['random'] = random
-        if output_folder is not None:
-            command_args['output_folder'] = output_folder
-        if include_hidden:
-            command_args['include_hidden'] = include_hidden
-        if omit_properties is not None:
-            command_args['omit_properties'] = omit_properties
-            
+        command_args.update(
+            (key, filter_options[param])
+            for param, key, is_flag in _FILTER_OPTIONS
+            if (filter_options[param] if is_flag else filter_options[param] is not None)
+        )
+        
         # Check if we have the validate_and_apply_config function
         # If not, use a simple pass-through function that just returns the args
         if validate_and_apply_config is None:
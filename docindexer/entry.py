@@ -0,0 +1,40 @@
+"""Console entry point for DocIndexer.
+
+`docindexer --readme` only needs Rich's Markdown renderer, so it is answered
+here before Click, the validator and the command modules are imported. Every
+other invocation is handed to the Click group in docindexer.cli.
+"""
+
+import sys
+from pathlib import Path
+
+from rich.console import Console
+
+# Initialize console for rich output
+console = Console()
+
+# README shown by --readme, looked up in the current working directory
+_README_NAME = "README.md"
+
+
+def display_readme():
+    """Display the README file and exit."""
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
+    try:
+        readme_text = Path(_README_NAME).read_text(encoding='utf-8', errors='replace')
+        console.print(Panel(Markdown(readme_text), title="README", border_style="blue"))
+        sys.exit(0)
+    except FileNotFoundError:
+        console.print("[bold red]README.md not found![/]")
+        sys.exit(1)
+
+
+def run():
+    """Run the DocIndexer command line."""
+    if sys.argv[1:2] == ['--readme']:
+        display_readme()
+
+    from .cli import main
+    main()
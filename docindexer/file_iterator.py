@@ -3,23 +3,20 @@
 import os
 import fnmatch
 import re
-import json
 import random
 from pathlib import Path
+from stat import S_ISREG
 from typing import Dict, List, Optional, Set, Iterator, Pattern, Union, Callable, Any, Iterable
-from dataclasses import dataclass
 from enum import Enum, auto
 import logging
 from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
 from abc import ABC, abstractmethod
 
+from . import json_utils
 from .config import Configuration
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
@@ -35,23 +32,119 @@ class SortOrder(Enum):
     NONE = auto()
 
 
-@dataclass
+# Sort orders that are applied with reverse=True
+_DESCENDING_ORDERS = frozenset({SortOrder.NAME_DESC, SortOrder.DATE_DESC, SortOrder.SIZE_DESC})
+
+# Sort keys by order; attrgetter reads the FileInfo attribute without a
+# Python-level call per file
+_SORT_KEYS = {
+    SortOrder.NAME_ASC: attrgetter('name'),
+    SortOrder.NAME_DESC: attrgetter('name'),
+    SortOrder.DATE_ASC: attrgetter('modified'),
+    SortOrder.DATE_DESC: attrgetter('modified'),
+    SortOrder.SIZE_ASC: attrgetter('size'),
+    SortOrder.SIZE_DESC: attrgetter('size'),
+}
+_DEFAULT_SORT_KEY = attrgetter('path')
+
+
 class FileInfo:
-    """Information about a file."""
-    path: Path
-    size: int
-    modified: float
-    extension: str
+    """Information about a file.
+    
+    Directory scans pass the path as the string os.scandir produced; the
+    Path object is only built when first requested, since most discovered
+    files are just filtered, sorted and counted. Instances have no
+    __dict__, as large trees produce one per file.
+    """
+    
+    __slots__ = ('_path', 'name', 'size', 'modified', 'extension')
+    
+    def __init__(self, path: Union[str, Path], size: int, modified: float, extension: str,
+                 name: Optional[str] = None):
+        """Initialize file information.
+        
+        Args:
+            path: Path to the file, as a string or Path
+            size: File size in bytes
+            modified: Modification time as Unix timestamp
+            extension: Lower-cased file extension including the dot
+            name: File name, if already known (derived from path otherwise)
+        """
+        self._path = path
+        self.name = os.path.basename(path) if name is None else name
+        self.size = size
+        self.modified = modified
+        self.extension = extension
     
     @property
-    def name(self) -> str:
-        """Get the file name."""
-        return self.path.name
+    def path(self) -> Path:
+        """Get the file path."""
+        path = self._path
+        if not isinstance(path, Path):
+            path = self._path = Path(path)
+        return path
     
     @property
     def absolute_path(self) -> str:
         """Get the absolute path as a string."""
-        return str(self.path.absolute())
+        path = self.path
+        if path.drive or path.root:
+            return str(path.absolute())
+        # A plain relative path is already normalized by Path, so joining it
+        # onto the working directory gives Path.absolute()'s result without
+        # building and re-parsing a second Path
+        return os.path.join(os.getcwd(), str(path))
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FileInfo):
+            return NotImplemented
+        return (self.path, self.size, self.modified, self.extension) == (
+            other.path, other.size, other.modified, other.extension)
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return (f"FileInfo(path={self.path!r}, size={self.size!r}, "
+                f"modified={self.modified!r}, extension={self.extension!r})")
+    
+    @classmethod
+    def from_stat(cls, path: Union[str, Path], stat: os.stat_result) -> 'FileInfo':
+        """Create a FileInfo instance from a path and its stat() result.
+        
+        Args:
+            path: Path to the file
+            stat: Result of stat() on the path
+            
+        Returns:
+            FileInfo object containing file details
+        """
+        return cls(
+            path=path,
+            size=stat.st_size,
+            modified=stat.st_mtime,
+            extension=os.path.splitext(path)[1].lower(),
+        )
+    
+    @classmethod
+    def from_direntry(cls, entry: os.DirEntry, extension: Optional[str] = None) -> 'FileInfo':
+        """Create a FileInfo instance from an os.scandir() entry.
+        
+        The entry's path and name strings are used as they are. Its stat()
+        result comes from the directory listing on Windows and costs one
+        stat() call elsewhere, so callers should filter on the name first.
+        
+        Args:
+            entry: Directory entry of a file
+            extension: Lower-cased extension, if the caller already computed it
+            
+        Returns:
+            FileInfo object containing file details
+        """
+        name = entry.name
+        if extension is None:
+            extension = os.path.splitext(name)[1].lower()
+        stat = entry.stat()
+        return cls(entry.path, stat.st_size, stat.st_mtime, extension, name)
     
     @classmethod
     def from_path(cls, path: Path) -> 'FileInfo':
@@ -72,6 +165,25 @@ class FileInfo:
         )
 
 
+def _stat_regular_file(path: str) -> Optional[os.stat_result]:
+    """Stat a path that should name a regular file.
+    
+    One stat() call answers both whether the file exists and what its
+    size and modification time are.
+    
+    Args:
+        path: Path to check
+        
+    Returns:
+        The stat result, or None if the path is missing or not a regular file
+    """
+    try:
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return stat if S_ISREG(stat.st_mode) else None
+
+
 class FileFilter(ABC):
     """Abstract base class for file filters."""
     
@@ -97,7 +209,8 @@ class ExtensionFilter(FileFilter):
         Args:
             extensions: List of allowed file extensions (with or without dots)
         """
-        self.extensions = [ext.lower() if ext.startswith('.') else f'.{ext.lower()}' for ext in extensions]
+        # A set keeps the per-file membership test O(1)
+        self.extensions = frozenset(ext.lower() if ext.startswith('.') else f'.{ext.lower()}' for ext in extensions)
     
     def matches(self, file_info: FileInfo) -> bool:
         """Check if a file's extension matches the allowed extensions.
@@ -111,6 +224,34 @@ class ExtensionFilter(FileFilter):
         return file_info.extension in self.extensions
 
 
+# Extensions of the document types DocIndexer processes
+_SUPPORTED_EXTENSIONS = (
+    '.txt', '.md', '.pdf', '.docx', '.doc',
+    '.html', '.htm', '.xml', '.json'
+)
+
+
+# Glob patterns match case-insensitively where file names are case-insensitive,
+# as fnmatch.fnmatch does through os.path.normcase
+_GLOB_FLAGS = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+
+
+@lru_cache(maxsize=32)
+def _compile_pattern(pattern: str, glob: bool) -> Pattern:
+    """Compile a file name pattern, memoized across filters.
+    
+    Args:
+        pattern: Glob or regular expression pattern
+        glob: Whether the pattern is a glob (True) or a regex (False)
+        
+    Returns:
+        Compiled regular expression
+    """
+    if glob:
+        return re.compile(fnmatch.translate(pattern), _GLOB_FLAGS)
+    return re.compile(pattern)
+
+
 class PatternFilter(FileFilter):
     """Filter files by name pattern."""
     
@@ -123,8 +264,11 @@ class PatternFilter(FileFilter):
         """
         self.pattern = pattern
         self.glob = glob
-        if not glob:
-            self.regex = re.compile(pattern)
+        # Compile once per filter (and reuse across filters) rather than per
+        # file, as fnmatch.fnmatch would re-normalize and look up its
+        # translation for every name
+        self.regex = _compile_pattern(pattern, glob)
+        self._match = self.regex.match if glob else self.regex.search
     
     def matches(self, file_info: FileInfo) -> bool:
         """Check if a file's name matches the pattern.
@@ -135,10 +279,20 @@ class PatternFilter(FileFilter):
         Returns:
             True if the file's name matches the pattern, False otherwise
         """
-        if self.glob:
-            return fnmatch.fnmatch(file_info.name, self.pattern)
-        else:
-            return bool(self.regex.search(file_info.name))
+        return self._match(file_info.name) is not None
+    
+    def matches_name(self, name: str) -> bool:
+        """Check if a file name matches the pattern.
+        
+        Lets directory scans reject an entry before building its FileInfo.
+        
+        Args:
+            name: File name to check
+            
+        Returns:
+            True if the name matches the pattern, False otherwise
+        """
+        return self._match(name) is not None
 
 
 class SizeFilter(FileFilter):
@@ -219,7 +373,11 @@ class CompositeFilter(FileFilter):
         Returns:
             True if the file matches all filters, False otherwise
         """
-        return all(f.matches(file_info) for f in self.filters)
+        # A plain loop avoids creating a generator for all() on every file
+        for file_filter in self.filters:
+            if not file_filter.matches(file_info):
+                return False
+        return True
 
 
 class FileIterator:
@@ -232,7 +390,13 @@ class FileIterator:
             config: Configuration object with file discovery settings
         """
         self.config = config
-        self.file_filter = self._create_filter()
+        self._extension_filter = ExtensionFilter(_SUPPORTED_EXTENSIONS)
+        attribute_filters = self._create_attribute_filters()
+        self.file_filter = CompositeFilter([self._extension_filter] + attribute_filters)
+        # Directory scans check an entry's name (extension and pattern)
+        # before stat(), so they only apply the remaining filters to a FileInfo
+        self._name_filters = [f for f in attribute_filters if isinstance(f, PatternFilter)]
+        self._scan_filter = CompositeFilter([f for f in attribute_filters if not isinstance(f, PatternFilter)])
         self._files: List[FileInfo] = []
         self._index = 0
         self._loaded = False
@@ -277,21 +441,14 @@ class FileIterator:
                 return os.path.join(output_folder, input_path.with_suffix(target_extension).name)
 
     
-    def _create_filter(self) -> FileFilter:
-        """Create a composite filter based on configuration parameters.
+    def _create_attribute_filters(self) -> List[FileFilter]:
+        """Create the name, size and date filters given by configuration parameters.
         
         Returns:
-            FileFilter to apply to files
+            List of filters to apply to files in addition to the extension filter
         """
         filters = []
         
-        # Add extension filter if specified
-        supported_extensions = [
-            '.txt', '.md', '.pdf', '.docx', '.doc',
-            '.html', '.htm', '.xml', '.json'
-        ]
-        filters.append(ExtensionFilter(supported_extensions))
-        
         # Add pattern filter if specified
         pattern = self.config.get('pattern')
         if pattern:
@@ -310,7 +467,7 @@ class FileIterator:
         if min_date is not None or max_date is not None:
             filters.append(DateFilter(min_date, max_date))
         
-        return CompositeFilter(filters)
+        return filters
     
     def _get_sort_key(self) -> Callable[[FileInfo], Any]:
         """Get a sort key function based on configuration.
@@ -318,22 +475,7 @@ class FileIterator:
         Returns:
             Function to use as key for sorting
         """
-        sort_order = self._get_sort_order()
-        
-        if sort_order == SortOrder.NAME_ASC:
-            return lambda f: f.name
-        elif sort_order == SortOrder.NAME_DESC:
-            return lambda f: f.name
-        elif sort_order == SortOrder.DATE_ASC:
-            return lambda f: f.modified
-        elif sort_order == SortOrder.DATE_DESC:
-            return lambda f: f.modified
-        elif sort_order == SortOrder.SIZE_ASC:
-            return lambda f: f.size
-        elif sort_order == SortOrder.SIZE_DESC:
-            return lambda f: f.size
-        else:  # Default or NONE
-            return lambda f: f.path
+        return _SORT_KEYS.get(self._get_sort_order(), _DEFAULT_SORT_KEY)
     
     def _get_sort_order(self) -> SortOrder:
         """Determine sort order from configuration.
@@ -356,24 +498,29 @@ class FileIterator:
         else:
             return SortOrder.NONE
     
-    def _discover_files(self) -> None:
-        """Discover files based on configuration parameters."""
-        self._files = []
+    def _discover_files(self) -> Iterator[FileInfo]:
+        """Discover files based on configuration parameters.
+        
+        Files are produced as they are found, so a caller that stops early
+        (e.g. once a limit is reached) also stops the scan.
         
+        Yields:
+            FileInfo for each file that passes the filters
+        """
         # Check if we have a catalogue file
         catalogue_path = self.config.get('catalogue')
         if catalogue_path:
-            self._load_from_catalogue(catalogue_path)
+            yield from self._read_catalogue(catalogue_path)
             return
         
         # Check if we have a single file
         file_name = self.config.get('file_name')
         if file_name:
-            path = Path(file_name)
-            if path.exists() and path.is_file():
-                file_info = FileInfo.from_path(path)
+            stat = _stat_regular_file(file_name)
+            if stat is not None:
+                file_info = FileInfo.from_stat(file_name, stat)
                 if self.file_filter.matches(file_info):
-                    self._files.append(file_info)
+                    yield file_info
             else:
                 logger.warning(f"File not found: {file_name}")
             return
@@ -383,32 +530,36 @@ class FileIterator:
         recursive = self.config.get('recursive', True)
         max_depth = self.config.get('max_depth')
         
-        self._scan_directory(Path(source_folder), recursive, max_depth=max_depth)
+        yield from self._scan_directory(source_folder, recursive, max_depth=max_depth)
     
-    def _load_from_catalogue(self, catalogue_path: str) -> None:
-        """Load files from a catalogue JSON file.
+    def _read_catalogue(self, catalogue_path: str) -> Iterator[FileInfo]:
+        """Read files from a catalogue JSON file.
         
         Args:
             catalogue_path: Path to the catalogue file
+            
+        Yields:
+            FileInfo for each listed file that exists and passes the filters
         """
         try:
-            with open(catalogue_path, 'r') as f:
-                catalogue = json.load(f)
+            with open(catalogue_path, 'rb') as f:
+                catalogue = json_utils.loads(f.read())
             
             # Process file entries in the catalogue
             for entry in catalogue.get('files', []):
                 if isinstance(entry, str):
                     # Simple string path entry
-                    path = Path(entry)
-                    if path.exists() and path.is_file():
-                        file_info = FileInfo.from_path(path)
+                    stat = _stat_regular_file(entry)
+                    if stat is not None:
+                        file_info = FileInfo.from_stat(entry, stat)
                         if self.file_filter.matches(file_info):
-                            self._files.append(file_info)
-                elif isinstance(entry, dict) and 'path' in entry:
+                            yield file_info
+                elif isinstance(entry, dict) and isinstance(entry.get('path'), str):
                     # Dictionary entry with path key
-                    path = Path(entry['path'])
-                    if path.exists() and path.is_file():
-                        # Use provided metadata if available, otherwise get from path
+                    path = entry['path']
+                    stat = _stat_regular_file(path)
+                    if stat is not None:
+                        # Use provided metadata if available, otherwise get from the stat
                         if all(k in entry for k in ['size', 'modified', 'extension']):
                             file_info = FileInfo(
                                 path=path,
@@ -417,64 +568,112 @@ class FileIterator:
                                 extension=entry['extension'],
                             )
                         else:
-                            file_info = FileInfo.from_path(path)
+                            file_info = FileInfo.from_stat(path, stat)
                             
                         if self.file_filter.matches(file_info):
-                            self._files.append(file_info)
-                        
-            logger.info(f"Loaded {len(self._files)} files from catalogue: {catalogue_path}")
+                            yield file_info
             
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+        except (json_utils.JSONDecodeError, FileNotFoundError) as e:
             logger.error(f"Error loading catalogue file: {str(e)}")
     
-    def _scan_directory(self, directory: Path, recursive: bool, 
-                        current_depth: int = 0, max_depth: Optional[int] = None) -> None:
-        """Scan a directory for files recursively.
+    def _scan_directory(self, directory: Union[str, Path], recursive: bool,
+                        max_depth: Optional[int] = None) -> Iterator[FileInfo]:
+        """Scan a directory for files, descending into subdirectories if requested.
+        
+        Directories are walked depth-first from an explicit stack rather than
+        by recursion, so deep trees cost no extra Python frames and each
+        directory handle is closed before its subdirectories are opened.
         
         Args:
             directory: Directory path to scan
             recursive: Whether to scan subdirectories
-            current_depth: Current recursion depth
             max_depth: Maximum recursion depth (None for unlimited)
+            
+        Yields:
+            FileInfo for each file that passes the filters
         """
-        if not directory.exists():
-            logger.warning(f"Directory not found: {directory}")
-            return
-        
-        if not directory.is_dir():
-            logger.warning(f"Not a directory: {directory}")
-            return
+        # Everything the per-entry loop uses is bound to locals once
+        skip_hidden = not self._include_hidden
+        extensions = self._extension_filter.extensions
+        name_filters = self._name_filters
+        scan_matches = self._scan_filter.matches
+        from_direntry = FileInfo.from_direntry
+        
+        stack = [(directory, 0)]
+        while stack:
+            directory, depth = stack.pop()
             
-        # Check max depth
-        if max_depth is not None and current_depth > max_depth:
-            return
-        
-        try:
-            for item in directory.iterdir():
-                # Skip hidden files/directories unless explicitly included
-                if not self._include_hidden and item.name.startswith('.'):
-                    continue
-                    
-                if item.is_file():
-                    file_info = FileInfo.from_path(item)
-                    if self.file_filter.matches(file_info):
-                        self._files.append(file_info)
-                elif recursive and item.is_dir():
-                    self._scan_directory(item, recursive, current_depth + 1, max_depth)
-        except (PermissionError, OSError) as e:
-            logger.warning(f"Error accessing {directory}: {str(e)}")
+            # Check max depth
+            if max_depth is not None and depth > max_depth:
+                continue
+            
+            subdirectories = []
+            try:
+                # scandir reports each entry's type from the directory listing, so
+                # is_file()/is_dir() need no extra stat() call (except for symlinks).
+                # A missing or non-directory path is reported by scandir itself
+                # rather than checked with separate exists()/is_dir() calls;
+                # errors for individual entries are handled in the loop.
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        # Skip hidden files/directories unless explicitly included
+                        # (directory entry names are never empty)
+                        if skip_hidden and name[0] == '.':
+                            continue
+                            
+                        if entry.is_file():
+                            # Most entries are rejected by extension; do that
+                            # before paying for stat(). Slicing at the last dot
+                            # gives os.path.splitext's extension, except that
+                            # leading dots never start one ('.md' has none).
+                            dot = name.rfind('.')
+                            if dot <= 0 or (name[0] == '.' and not name[:dot].lstrip('.')):
+                                continue
+                            extension = name[dot:].lower()
+                            if extension not in extensions:
+                                continue
+                            if name_filters and not all(f.matches_name(name) for f in name_filters):
+                                continue
+                            try:
+                                file_info = from_direntry(entry, extension)
+                            except OSError as e:
+                                # The file went away (or became unreadable) after
+                                # it was listed; skip only this entry
+                                logger.warning(f"Error accessing {entry.path}: {str(e)}")
+                                continue
+                            if scan_matches(file_info):
+                                yield file_info
+                        elif recursive and entry.is_dir():
+                            subdirectories.append(entry.path)
+            except FileNotFoundError:
+                logger.warning(f"Directory not found: {directory}")
+            except NotADirectoryError:
+                logger.warning(f"Not a directory: {directory}")
+            except (PermissionError, OSError) as e:
+                logger.warning(f"Error accessing {directory}: {str(e)}")
+            
+            # Pushed in reverse so they are visited in listing order
+            stack.extend((subdirectory, depth + 1) for subdirectory in reversed(subdirectories))
     
     def load(self) -> None:
         """Discover and load files based on configuration."""
         if self._loaded:
             return
             
-        self._discover_files()
-        
-        # Apply limit if specified
+        # Apply limit if specified; the first files found are kept, so
+        # discovery stops as soon as enough of them have been found
         limit = self.config.get('limit')
-        if limit is not None and limit > 0 and limit < len(self._files):
-            self._files = self._files[:limit]
+        if limit is not None and limit > 0:
+            self._files = list(islice(self._discover_files(), limit))
+        else:
+            self._files = list(self._discover_files())
+        
+        # Logged here rather than by _read_catalogue, which is closed
+        # before it finishes when the limit is reached
+        catalogue_path = self.config.get('catalogue')
+        if catalogue_path:
+            logger.info(f"Loaded {len(self._files)} files from catalogue: {catalogue_path}")
         
         # Apply sorting
         sort_order = self._get_sort_order()
@@ -482,7 +681,7 @@ class FileIterator:
             random.shuffle(self._files)
         else:
             sort_key = self._get_sort_key()
-            reverse = sort_order in [SortOrder.NAME_DESC, SortOrder.DATE_DESC, SortOrder.SIZE_DESC]
+            reverse = sort_order in _DESCENDING_ORDERS
             self._files.sort(key=sort_key, reverse=reverse)
         
         self._loaded = True
@@ -588,12 +787,21 @@ class CatalogueBuilder:
             self.add_file(file_info)
     
     def save(self) -> None:
-        """Save the catalogue to a file."""
-        catalogue = {
-            "files": self.files
-        }
+        """Save the catalogue to a file.
         
-        with open(self.output_path, 'w') as f:
-            json.dump(catalogue, f, indent=2)
+        Entries are encoded and written one per line. An indented dump of
+        the whole document would go through the pure-Python encoder of the
+        json module; this way each entry is encoded by json_utils (orjson
+        when it is installed, the C encoder otherwise).
+        """
+        dumps_bytes = json_utils.dumps_bytes
+        with open(self.output_path, 'wb') as f:
+            f.write(b'{\n  "files": [')
+            separator = b'\n    '
+            for entry in self.files:
+                f.write(separator)
+                f.write(dumps_bytes(entry))
+                separator = b',\n    '
+            f.write(b'\n  ]\n}' if self.files else b']\n}')
         
         logger.info(f"Saved catalogue with {len(self.files)} files to {self.output_path}")
\ No newline at end of file
@@ -2,12 +2,10 @@
 """Implementation of the index command for DocIndexer CLI."""
 
 import json
+import os
 from typing import Dict, Any
-from pathlib import Path
 import click
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
 from .indexer import DocIndexer
 from .validator import ValidationError
@@ -69,14 +67,18 @@ def execute_index_command(config_manager, args: Dict[str, Any], validate_and_app
             
             # Display results
             if results:
+                from rich.table import Table
+
                 table = Table(title="Indexed Documents")
                 table.add_column("Path", style="cyan")
                 table.add_column("Size", style="green")
                 table.add_column("Extension", style="yellow")
                 
+                # Rows only need the base name, so skip building a Path per result
+                add_row = table.add_row
                 for file_path, info in results.items():
-                    table.add_row(
-                        Path(file_path).name, 
+                    add_row(
+                        os.path.basename(file_path),
                         f"{info['size'] / 1024:.2f} KB",
                         info['extension']
                     )
@@ -1,10 +1,10 @@
 """Document indexing functionality."""
 
 import os
-import json
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 
+from . import json_utils
 from .config import Configuration
 from .file_iterator import FileIterator, FileInfo
 
@@ -74,9 +74,22 @@ class DocIndexer:
         self.index[str(file_path)] = file_data
 
     def _save_index(self) -> None:
-        """Save the index to a file."""
+        """Save the index to a file.
+
+        Entries are encoded and written one per line, so the whole index is
+        never held as a single serialized document.
+        """
         if not self.output_path:
             return
 
-        with open(self.output_path, 'w') as f:
-            json.dump(self.index, f, indent=2)
\ No newline at end of file
+        dumps_bytes = json_utils.dumps_bytes
+        with open(self.output_path, 'wb') as f:
+            f.write(b'{')
+            separator = b'\n  '
+            for file_path, file_data in self.index.items():
+                f.write(separator)
+                f.write(dumps_bytes(file_path))
+                f.write(b': ')
+                f.write(dumps_bytes(file_data))
+                separator = b',\n  '
+            f.write(b'\n}' if self.index else b'}')
\ No newline at end of file
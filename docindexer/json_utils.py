@@ -0,0 +1,76 @@
+"""JSON (de)serialization helpers for DocIndexer.
+
+orjson is used when it is installed; otherwise the standard library json
+module is used. Both backends raise json.JSONDecodeError (orjson's error is
+a subclass of it), so callers only need to handle that one exception type.
+Non-ASCII text is written as UTF-8 rather than \\u escapes with either backend.
+"""
+
+import json
+from collections.abc import Mapping
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Convert values neither backend serializes natively.
+    
+    Read-only mappings (e.g. Configuration.as_dict()) are serialized as
+    JSON objects.
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: Raw JSON bytes or text
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """Serialize a value to UTF-8 encoded JSON.
+
+    Args:
+        obj: Value to serialize
+        indent: Pretty-print with a two-space indent
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=_default).encode('utf-8')
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize a value to a JSON string.
+
+    Args:
+        obj: Value to serialize
+        indent: Pretty-print with a two-space indent
+
+    Returns:
+        JSON document as text
+    """
+    if orjson is not None:
+        return dumps_bytes(obj, indent).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=_default)
@@ -1,21 +1,22 @@
 #!/usr/bin/env python3
 """Implementation of the list command for DocIndexer CLI."""
 
-import json
+import time
 from typing import Dict, Any
-from datetime import datetime
 import click
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress
 
+from . import json_utils
+from .common_options import common_options
 from .file_iterator import FileIterator, FileInfo
 from .validator import ValidationError
 
 # Initialize console for rich output
 console = Console()
 
+# Display format for file modification times
+_MODIFIED_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
 def format_size(size: int) -> str:
     """Format file size in human-readable format.
     
@@ -43,6 +44,9 @@ def execute_list_command(config_manager, args: Dict[str, Any], validate_and_appl
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    from rich.panel import Panel
+    from rich.table import Table
+
     try:
         # Validate and apply configuration
         effective_config = validate_and_apply_config('list', args)
@@ -50,7 +54,11 @@ def execute_list_command(config_manager, args: Dict[str, Any], validate_and_appl
         # Show debug information if requested
         if args.get('debug', False):
             console.print("\n[bold blue]Configuration:[/]")
-            console.print(Panel(json.dumps(effective_config, indent=2), title="Effective Configuration"))
+            if console.is_terminal:
+                console.print(Panel(json_utils.dumps(effective_config, indent=True), title="Effective Configuration"))
+            else:
+                # Piped output gets a single compact line instead of a panel
+                console.out(json_utils.dumps(effective_config), highlight=False)
         
         # Create file iterator
         file_iterator = FileIterator(config_manager)
@@ -58,40 +66,43 @@ def execute_list_command(config_manager, args: Dict[str, Any], validate_and_appl
         # Display file count and processing message
         console.print(f"\n[bold]Finding files based on configuration...[/]")
         
-        # Load files with progress indicator
-        with Progress() as progress:
-            task = progress.add_task("[cyan]Scanning directories...", total=None)
+        # Discovery is a single call (sorting and limits need the full result),
+        # so a spinner stands in for a progress bar while it runs
+        with console.status("[cyan]Scanning directories..."):
             file_iterator.load()
-            progress.update(task, completed=100)
-        
-        file_count = file_iterator.count()
-        
-        if file_count == 0:
-            console.print("[yellow]No files found matching the criteria.[/]")
-            return 0
         
         # Create a table to display files
-        table = Table(title=f"Found {file_count} files")
+        table = Table()
         table.add_column("File Name", style="cyan")
         table.add_column("Path", style="green")
         table.add_column("Size", style="yellow", justify="right")
         table.add_column("Modified", style="magenta")
         
-        # Add files to the table
+        # Add files to the table, counting them in the same pass
+        add_row = table.add_row
+        localtime = time.localtime
+        strftime = time.strftime
+        file_count = 0
         for file_info in file_iterator:
-            # Format the modified time
-            modified_time = datetime.fromtimestamp(file_info.modified).strftime('%Y-%m-%d %H:%M:%S')
+            # Format the modified time (time.localtime avoids building a datetime per row)
+            modified_time = strftime(_MODIFIED_TIME_FORMAT, localtime(file_info.modified))
             
             # Format the size
             size_str = format_size(file_info.size)
             
-            table.add_row(
+            add_row(
                 file_info.name,
                 str(file_info.path.parent),
                 size_str,
                 modified_time
             )
+            file_count += 1
+        
+        if file_count == 0:
+            console.print("[yellow]No files found matching the criteria.[/]")
+            return 0
         
+        table.title = f"Found {file_count} files"
         console.print(table)
         
         return 0
@@ -115,9 +126,7 @@ def setup_list_command(main_group, validate_and_apply_config, config_manager):
     """
     @main_group.command()
     # Common options for file discovery
-    @click.option('--source-folder', '-s', help='Path to the folder containing files to be processed')
-    @click.option('--catalogue', '-c', help='Path to a catalogue JSON file')
-    @click.option('--file-name', '-n', help='the name of the file to be processed')
+    @common_options
     
     # Common file filtering options (moved from command-specific to common)
     @click.option('--pattern', '-p', help='Pattern to match file names (glob pattern by default). Patterns must be included in quotes')
@@ -3,22 +3,29 @@
 
 import click
 from rich.console import Console
-from rich.tree import Tree
 
 # Initialize console for rich output
 console = Console()
 
-def execute_schema_command(validator):
-    """Execute the schema command.
+# Rendered schema trees keyed by id() of the schema dict. The dict itself is
+# stored alongside so a recycled id can never return a stale tree.
+_schema_tree_cache = {}
+
+def _build_schema_tree(schema_data):
+    """Build (or reuse) the Rich tree visualizing a CLI schema.
     
     Args:
-        validator: SchemaValidator instance
+        schema_data: Parsed CLI schema dictionary
         
     Returns:
-        Exit code (0 for success, 1 for error)
+        Tree renderable for the schema
     """
-    schema_data = validator.schema
+    cached = _schema_tree_cache.get(id(schema_data))
+    if cached is not None and cached[0] is schema_data:
+        return cached[1]
     
+    from rich.tree import Tree
+
     # Create a tree visualization of the schema
     tree = Tree(f"[bold magenta]{schema_data['name']} CLI[/bold magenta]")
     
@@ -57,7 +64,19 @@ def execute_schema_command(validator):
             priority = source.get('priority', 0)
             config_branch.add(f"[cyan]{priority}.[/cyan] {source['name']}: {source['description']}")
     
-    console.print(tree)
+    _schema_tree_cache[id(schema_data)] = (schema_data, tree)
+    return tree
+
+def execute_schema_command(validator):
+    """Execute the schema command.
+    
+    Args:
+        validator: SchemaValidator instance
+        
+    Returns:
+        Exit code (0 for success, 1 for error)
+    """
+    console.print(_build_schema_tree(validator.schema))
     return 0
 
 def setup_schema_command(main_group, validator):
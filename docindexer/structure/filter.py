@@ -23,37 +23,45 @@ class Filter:
         Returns:
             New document structure with specified properties removed
         """
-        # Create a deep copy to avoid modifying the original
-        filtered_doc = deepcopy(document_structure)
-        
         # Convert list to set for O(1) lookups
         properties_to_exclude = set(exclude_properties)
         
-        # Filter the document structure recursively
-        self._filter_node(filtered_doc, properties_to_exclude)
-        
-        return filtered_doc
+        # Build the filtered copy in one pass; the original is left untouched
+        return self._filter_node(document_structure, properties_to_exclude)
     
-    def _filter_node(self, node: Dict[str, Any], exclude_properties: Set[str]) -> None:
+    def _filter_node(self, node: Dict[str, Any], exclude_properties: Set[str]) -> Dict[str, Any]:
         """
-        Recursively filter properties from a node and its children.
+        Build a copy of a node and its children without the excluded properties.
+        
+        The tree is walked with an explicit stack rather than recursion, so deeply
+        nested lists and blockquotes cannot hit the recursion limit. Each child's
+        (empty) copy is placed in its parent's list when the parent is visited,
+        which keeps the original element order regardless of visiting order.
         
         Args:
             node: Node to filter
             exclude_properties: Set of property names to exclude
+            
+        Returns:
+            Filtered copy of the node
         """
-        # Remove excluded properties from the current node
-        for prop in exclude_properties:
-            node.pop(prop, None)
-        
-        # Process any child elements
-        if "elements" in node:
-            for child in node["elements"]:
-                self._filter_node(child, exclude_properties)
-        
-        # Process list items if present
-        if "items" in node:
-            for item in node["items"]:
-                self._filter_node(item, exclude_properties)
-        
-        # Note: No need to process table rows as they are just strings
\ No newline at end of file
+        root: Dict[str, Any] = {}
+        stack = [(node, root)]
+        while stack:
+            source, filtered = stack.pop()
+            for key, value in source.items():
+                if key in exclude_properties:
+                    continue
+                if key == "elements" or key == "items":
+                    # Child elements and list items are nodes themselves
+                    children = []
+                    for child in value:
+                        child_copy: Dict[str, Any] = {}
+                        children.append(child_copy)
+                        stack.append((child, child_copy))
+                    value = children
+                elif isinstance(value, (dict, list)):
+                    # Other containers (e.g. table rows) are copied unfiltered
+                    value = deepcopy(value)
+                filtered[key] = value
+        return root
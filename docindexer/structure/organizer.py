@@ -2,7 +2,6 @@
 Document organizer module for creating hierarchical structure from markdown files.
 Uses markdown-it-py for proper markdown parsing.
 """
-import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
@@ -10,6 +9,7 @@ from typing import Dict, List, Any, Optional
 from markdown_it import MarkdownIt
 from markdown_it.token import Token
 
+from .. import json_utils
 from .node_factory import NodeFactory
 
 
@@ -654,8 +654,8 @@ class Organizer:
             )
 
             
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(filtered_structure, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(json_utils.dumps_bytes(filtered_structure, indent=True))
     
     @staticmethod
     def load_structure_from_markdown_content(markdown_content: str) -> Dict[str, Any]:
@@ -1,15 +1,15 @@
 #!/usr/bin/env python3
 """Implementation of the structure command for DocIndexer CLI."""
 
-import json
 import os
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 import click
 from rich.console import Console
-from rich.progress import Progress
 
+from . import json_utils
+from .common_options import common_options
 from .file_iterator import FileIterator, FileInfo
 from .validator import ValidationError
 from .structure.organizer import Organizer
@@ -17,6 +17,10 @@ from .structure.organizer import Organizer
 # Initialize console for rich output
 console = Console()
 
+# Upper bound on progress bar updates per run and on redraws per second
+_PROGRESS_STEPS = 100
+_PROGRESS_REFRESH_PER_SECOND = 10
+
 
 
 def execute_structure_command(config_manager, args: Dict[str, Any], validate_and_apply_config):
@@ -30,6 +34,8 @@ def execute_structure_command(config_manager, args: Dict[str, Any], validate_and
     Returns:
         Exit code (0 for success, 1 for error)
     """
+    from rich.progress import Progress
+
     try:
         # Validate and apply configuration
         effective_config = validate_and_apply_config('structure', args)
@@ -37,7 +43,10 @@ def execute_structure_command(config_manager, args: Dict[str, Any], validate_and
         # Show debug information if requested
         if args.get('debug', False):
             console.print("\n[bold blue]Configuration:[/]")
-            console.print(json.dumps(effective_config, indent=2))
+            if console.is_terminal:
+                console.print(json_utils.dumps(effective_config, indent=True))
+            else:
+                console.out(json_utils.dumps(effective_config), highlight=False)
         
         # Create file iterator to get the list of files
         console.print(f"\n[bold]Finding files based on configuration...[/]")
@@ -47,7 +56,10 @@ def execute_structure_command(config_manager, args: Dict[str, Any], validate_and
         with Progress() as progress:
             task = progress.add_task("[cyan]Scanning directories...", total=None)
             file_iterator.load()
-            progress.update(task, completed=100)
+            # Discovery is a single call, so the bar completes with the real
+            # count (an empty result still shows as done rather than 0%)
+            found = file_iterator.count() or 1
+            progress.update(task, total=found, completed=found)
         
         # Get the list of files
         files = file_iterator.get_files()
@@ -74,12 +86,14 @@ def execute_structure_command(config_manager, args: Dict[str, Any], validate_and
         from .structure.filter import Filter
         filter_instance = Filter() if omit_properties else None
         
-        # Process files with progress indicator
-        with Progress() as progress:
+        # Process files with progress indicator. Progress is reported in
+        # batches of roughly 1% so large runs don't re-render per file.
+        update_every = max(1, file_count // _PROGRESS_STEPS)
+        with Progress(refresh_per_second=_PROGRESS_REFRESH_PER_SECOND) as progress:
             task = progress.add_task("[cyan]Processing files...", total=file_count)
             
             # Process each file
-            for file_info in files:
+            for processed, file_info in enumerate(files, start=1):
                 file_path = file_info.path
 
                 structure = Organizer.load_structure_from_markdown_file(file_path)
@@ -117,7 +131,8 @@ def execute_structure_command(config_manager, args: Dict[str, Any], validate_and
                     print(f"  - Would process: {file_path}")
                 
                 # Update progress
-                progress.update(task, advance=1)
+                if processed % update_every == 0 or processed == file_count:
+                    progress.update(task, completed=processed)
         
         console.print(f"\n[bold green]Structure processing complete![/]")
         console.print(f"[blue]Output folder: {output_folder}[/]")
@@ -144,9 +159,7 @@ def setup_structure_command(main_group, validate_and_apply_config, config_manage
     @main_group.command()
     @click.option('--omit-properties', help='Comma-separated list of properties to omit from the JSON output (e.g., "items,size")')
     # Common options for file discovery
-    @click.option('--source-folder', '-s', help='Path to the folder containing files to be processed')
-    @click.option('--catalogue', '-c', help='Path to a catalogue JSON file')
-    @click.option('--file-name', '-n', help='the name of the file to be processed')
+    @common_options
     
     # Common file filtering options
     @click.option('--pattern', '-p', help='Pattern to match file names (glob pattern by default)')
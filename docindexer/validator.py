@@ -1,18 +1,47 @@
 """CLI Schema Validator for DocIndexer."""
 
 import json
+import os
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+from . import json_utils
+
 logger = logging.getLogger(__name__)
 
+# Arguments passed through by the CLI that are not schema options
+_SPECIAL_ARGS = frozenset({'command', 'path'})
+
+# Number of distinct (command, arguments) results remembered by prepare()
+_PREPARED_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=4)
+def _read_schema(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a schema file, memoized on its path and stat signature.
+    
+    The mtime and size are part of the cache key so that an edited schema
+    file is re-parsed instead of served stale.
+    """
+    return json_utils.loads(Path(path).read_bytes())
+
+
+def _load_schema(schema_path: Union[str, Path]) -> Dict[str, Any]:
+    """Load a CLI schema file, reusing the parsed result when unchanged.
+    
+    Args:
+        schema_path: Path to the CLI schema file
+        
+    Returns:
+        Parsed schema dictionary (shared between callers; do not mutate)
+    """
+    st = os.stat(schema_path)
+    return _read_schema(str(schema_path), st.st_mtime_ns, st.st_size)
+
 
 class ValidationError(Exception):
     """Exception raised for CLI schema validation errors."""
@@ -73,6 +102,27 @@ class SchemaOption:
         return (True, None)
 
 
+@dataclass(slots=True)
+class CommandPlan:
+    """Schema-derived data used to prepare the arguments of one command.
+    
+    Attributes:
+        options: Option name -> SchemaOption for values the command accepts
+            (command options take precedence over global ones)
+        defaults: Option name -> default value (shared; do not mutate)
+        required: (option name, error message) for each required option
+        exclusive: (option name, other option name, error message) for each
+            mutually exclusive pair
+        dependencies: (option name, required option name, error message)
+            for each dependency
+    """
+    options: Dict[str, SchemaOption]
+    defaults: Dict[str, Any]
+    required: List[Tuple[str, str]]
+    exclusive: List[Tuple[str, str, str]]
+    dependencies: List[Tuple[str, str, str]]
+
+
 class SchemaValidator:
     """Validates command-line arguments against a CLI schema."""
     
@@ -89,6 +139,25 @@ class SchemaValidator:
         self.commands: List[str] = []
         self.config_sources: List[Dict[str, Any]] = []
         
+        # Argument name -> schema option name, seeded from the global and
+        # common option flags and extended as other names are normalized
+        self._option_names: Dict[str, str] = {'command': 'command'}
+        
+        # Flag (or alternative flag) -> option, per option group, for
+        # get_option_by_flag
+        self._global_flags: Dict[str, SchemaOption] = {}
+        self._common_flags: Dict[str, SchemaOption] = {}
+        self._command_flags: Dict[str, Dict[str, SchemaOption]] = {}
+        
+        # Defaults that apply without a (known) command: global, then common
+        self._base_defaults: Dict[str, Any] = {}
+        
+        # Command name -> precomputed plan, built when the schema is loaded
+        self._command_plans: Dict[str, CommandPlan] = {}
+        
+        # (command, frozenset of (name, type, value)) -> result of prepare()
+        self._prepared_cache: Dict[Tuple[str, frozenset], Tuple[Dict[str, Any], List[str]]] = {}
+        
         if schema_path:
             self.load_schema(schema_path)
     
@@ -102,8 +171,7 @@ class SchemaValidator:
             ValidationError: If the schema file is invalid or cannot be read
         """
         try:
-            with open(schema_path, 'r') as f:
-                self.schema = json.load(f)
+            self.schema = _load_schema(schema_path)
             
             # Process global options
             for option_data in self.schema.get("globalOptions", []):
@@ -138,6 +206,27 @@ class SchemaValidator:
             # Process configuration sources
             self.config_sources = self.schema.get("configurationSources", [])
             
+            # Precompute flag -> option name lookups used by normalize_args.
+            # Global options take precedence over common ones, matching
+            # get_option_by_flag.
+            self._option_names = {'command': 'command'}
+            for option in (*self.global_options.values(), *self.common_options.values()):
+                for flag in (option.flag, option.alt_flag):
+                    if flag:
+                        self._option_names.setdefault(flag, option.name)
+            
+            self._global_flags = self._index_flags(self.global_options)
+            self._common_flags = self._index_flags(self.common_options)
+            self._command_flags = {
+                command: self._index_flags(options) for command, options in self.command_options.items()
+            }
+            
+            # The schema is static once loaded, so everything needed to
+            # prepare a command's arguments is resolved up front
+            self._base_defaults = self._merge_defaults(self.global_options, self.common_options)
+            self._command_plans = {command: self._build_plan(command) for command in self.commands}
+            self._prepared_cache = {}
+            
             logger.debug(f"Successfully loaded schema: {len(self.commands)} commands, "
                        f"{len(self.global_options)} global options, "
                        f"{len(self.common_options)} common options")
@@ -158,11 +247,10 @@ class SchemaValidator:
         if command not in self.commands:
             return (False, [f"Unknown command: {command}"])
         
+        plan = self._command_plans[command]
+        options = plan.options
         errors = []
         
-        # Get command options
-        command_opts = self.command_options.get(command, {})
-        
         # Validate all provided arguments
         for arg_name, arg_value in args.items():
             # Skip None values (not provided)
@@ -170,54 +258,78 @@ class SchemaValidator:
                 continue
                 
             # Skip special arguments
-            if arg_name in ['command', 'path']:
+            if arg_name in _SPECIAL_ARGS:
                 continue
                 
             # Check if this is a valid option for this command
-            if arg_name in command_opts:
-                option = command_opts[arg_name]
-                is_valid, error = option.validate_value(arg_value)
-                if not is_valid:
-                    errors.append(error)
-            elif arg_name in self.global_options:
-                option = self.global_options[arg_name]
-                is_valid, error = option.validate_value(arg_value)
-                if not is_valid:
-                    errors.append(error)
-            else:
+            option = options.get(arg_name)
+            if option is None:
                 errors.append(f"Unknown option for command '{command}': {arg_name}")
+                continue
+            is_valid, error = option.validate_value(arg_value)
+            if not is_valid:
+                errors.append(error)
         
         # Check for required options
-        for opt_name, option in command_opts.items():
-            if option.required and (opt_name not in args or args[opt_name] is None):
-                errors.append(f"Required option missing: {option.flag}")
+        for opt_name, message in plan.required:
+            if args.get(opt_name) is None:
+                errors.append(message)
         
         # Check for mutually exclusive options
-        for opt_name, option in command_opts.items():
-            # Skip if this option isn't provided
-            if opt_name not in args or args[opt_name] is None:
-                continue
-                
-            for mutex_opt in option.mutually_exclusive_with:
-                if mutex_opt in args and args[mutex_opt] is not None:
-                    errors.append(
-                        f"Options {option.flag} and {command_opts[mutex_opt].flag} "
-                        f"cannot be used together"
-                    )
+        for opt_name, mutex_opt, message in plan.exclusive:
+            if args.get(opt_name) is not None and args.get(mutex_opt) is not None:
+                errors.append(message)
         
         # Check for required dependencies
+        for opt_name, req_opt, message in plan.dependencies:
+            if args.get(opt_name) is not None and args.get(req_opt) is None:
+                errors.append(message)
+        
+        return (len(errors) == 0, errors)
+    
+    def _build_plan(self, command: str) -> CommandPlan:
+        """Precompute the option lookup, defaults and cross-option rules for a command.
+        
+        Error messages for the cross-option rules are resolved here too, so
+        validation only has to check argument presence.
+        
+        Args:
+            command: Command name
+            
+        Returns:
+            CommandPlan for the command
+        """
+        command_opts = self.command_options.get(command, {})
+        
+        def flag_of(name: str) -> str:
+            # Referenced options missing from the command fall back to their name
+            option = command_opts.get(name)
+            return option.flag if option else name
+        
+        required = []
+        exclusive = []
+        dependencies = []
         for opt_name, option in command_opts.items():
-            # Skip if this option isn't provided
-            if opt_name not in args or args[opt_name] is None:
-                continue
-                
+            if option.required:
+                required.append((opt_name, f"Required option missing: {option.flag}"))
+            for mutex_opt in option.mutually_exclusive_with:
+                exclusive.append((
+                    opt_name, mutex_opt,
+                    f"Options {option.flag} and {flag_of(mutex_opt)} cannot be used together"
+                ))
             for req_opt in option.requires:
-                if req_opt not in args or args[req_opt] is None:
-                    errors.append(
-                        f"Option {option.flag} requires {command_opts[req_opt].flag}"
-                    )
+                dependencies.append((
+                    opt_name, req_opt,
+                    f"Option {option.flag} requires {flag_of(req_opt)}"
+                ))
         
-        return (len(errors) == 0, errors)
+        return CommandPlan(
+            options={**self.global_options, **command_opts},
+            defaults=self._merge_defaults(self.global_options, self.common_options, command_opts),
+            required=required,
+            exclusive=exclusive,
+            dependencies=dependencies,
+        )
     
     def get_option_by_flag(self, flag: str, command: Optional[str] = None) -> Optional[SchemaOption]:
         """Find a schema option by its flag or alternative flag.
@@ -229,23 +341,29 @@ class SchemaValidator:
         Returns:
             SchemaOption if found, None otherwise
         """
-        # Check global options
-        for opt in self.global_options.values():
-            if opt.flag == flag or opt.alt_flag == flag:
-                return opt
-        
-        # Check command options if command is provided
-        if command and command in self.command_options:
-            for opt in self.command_options[command].values():
-                if opt.flag == flag or opt.alt_flag == flag:
-                    return opt
-        
-        # Check common options
-        for opt in self.common_options.values():
-            if opt.flag == flag or opt.alt_flag == flag:
-                return opt
-                
-        return None
+        option = self._global_flags.get(flag)
+        if option is None and command:
+            option = self._command_flags.get(command, {}).get(flag)
+        if option is None:
+            option = self._common_flags.get(flag)
+        return option
+    
+    @staticmethod
+    def _index_flags(options: Dict[str, SchemaOption]) -> Dict[str, SchemaOption]:
+        """Index a group of options by flag and alternative flag.
+        
+        Args:
+            options: Option name -> SchemaOption
+            
+        Returns:
+            Dictionary of flag to option; the first option declaring a flag wins
+        """
+        index = {}
+        for option in options.values():
+            for flag in (option.flag, option.alt_flag):
+                if flag:
+                    index.setdefault(flag, option)
+        return index
     
     def normalize_args(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize argument names to match schema option names.
@@ -258,24 +376,24 @@ class SchemaValidator:
         Returns:
             Dictionary with normalized option names
         """
-        normalized = {}
+        option_names = self._option_names
+        return {
+            option_names.get(flag) or self._fallback_option_name(flag): value
+            for flag, value in args.items()
+        }
+    
+    def _fallback_option_name(self, flag: str) -> str:
+        """Derive (and remember) the option name for a flag not in the schema.
         
-        for flag, value in args.items():
-            # Skip special args
-            if flag == 'command':
-                normalized[flag] = value
-                continue
-                
-            # Try to find the option by flag
-            option = self.get_option_by_flag(flag)
-            if option:
-                normalized[option.name] = value
-            else:
-                # If not found, just use the flag name without dashes
-                normalized_name = flag.lstrip('-').replace('-', '_')
-                normalized[normalized_name] = value
-        
-        return normalized
+        Args:
+            flag: Argument or flag name, e.g. "--source-folder"
+            
+        Returns:
+            The flag name without leading dashes and with dashes as underscores
+        """
+        name = flag.lstrip('-').replace('-', '_')
+        self._option_names[flag] = name
+        return name
     
     def apply_defaults(self, args: Dict[str, Any], command: Optional[str] = None) -> Dict[str, Any]:
         """Apply default values to missing arguments.
@@ -287,22 +405,65 @@ class SchemaValidator:
         Returns:
             Dictionary with defaults applied
         """
+        plan = self._command_plans.get(command) if command else None
+        defaults = plan.defaults if plan is not None else self._base_defaults
+        
         result = args.copy()
+        for name, value in defaults.items():
+            if name not in result:
+                result[name] = value
         
-        # Apply global option defaults
-        for name, option in self.global_options.items():
-            if name not in result and option.default is not None:
-                result[name] = option.default
+        return result
+    
+    def prepare(self, command: str, args: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+        """Normalize arguments, apply defaults and validate them for a command.
         
-        # Apply common option defaults
-        for name, option in self.common_options.items():
-            if name not in result and option.default is not None:
-                result[name] = option.default
+        Results are remembered per command and argument values, so preparing
+        the same arguments again skips the schema checks.
         
-        # Apply command option defaults if command is provided
-        if command and command in self.command_options:
-            for name, option in self.command_options[command].items():
-                if name not in result and option.default is not None:
-                    result[name] = option.default
+        Args:
+            command: Command name
+            args: Dictionary of command-line arguments with flag names
+            
+        Returns:
+            Tuple of (arguments with defaults applied, error_messages)
+        """
+        try:
+            # The value types are part of the key: True, 1 and 1.0 compare
+            # equal but do not validate the same way
+            key = (command, frozenset((name, type(value), value) for name, value in args.items()))
+        except TypeError:
+            # Unhashable argument values (e.g. lists) are not cached
+            key = None
+        
+        cached = self._prepared_cache.get(key) if key is not None else None
+        if cached is None:
+            args_with_defaults = self.apply_defaults(self.normalize_args(args), command)
+            _, errors = self.validate_command(command, args_with_defaults)
+            cached = (args_with_defaults, errors)
+            if key is not None:
+                if len(self._prepared_cache) >= _PREPARED_CACHE_SIZE:
+                    self._prepared_cache.clear()
+                self._prepared_cache[key] = cached
+        
+        # Callers get their own copies so the cached result stays intact
+        args_with_defaults, errors = cached
+        return (dict(args_with_defaults), list(errors))
+    
+    @staticmethod
+    def _merge_defaults(*option_groups: Dict[str, SchemaOption]) -> Dict[str, Any]:
+        """Merge the default values of several option groups.
         
-        return result
\ No newline at end of file
+        Args:
+            option_groups: Option dictionaries in precedence order; the first
+                default seen for a name wins
+            
+        Returns:
+            Dictionary of option name to default value
+        """
+        defaults = {}
+        for options in option_groups:
+            for name, option in options.items():
+                if name not in defaults and option.default is not None:
+                    defaults[name] = option.default
+        return defaults
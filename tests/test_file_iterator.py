@@ -15,7 +15,7 @@ import time
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from docindexer.config import Configuration
-from docindexer.file_iterator import FileIterator, FileInfo, SortOrder
+from docindexer.file_iterator import FileIterator, FileInfo, SortOrder, CatalogueBuilder
 from docindexer.file_iterator import ExtensionFilter, PatternFilter, SizeFilter, DateFilter, CompositeFilter
 
 
@@ -50,6 +50,14 @@ class TestFileInfo(unittest.TestCase):
         
         self.assertEqual(file_info.name, "test.txt")
         self.assertEqual(file_info.absolute_path, str(path.absolute()))
+    
+    def test_string_path(self):
+        """Test that a FileInfo built from a string path exposes a Path."""
+        file_info = FileInfo(path=self.temp_file, size=12, modified=0.0, extension='.txt')
+        
+        self.assertEqual(file_info.name, "test.txt")
+        self.assertEqual(file_info.path, Path(self.temp_file))
+        self.assertEqual(file_info, FileInfo(Path(self.temp_file), 12, 0.0, '.txt'))
 
 
 class TestFileFilters(unittest.TestCase):
@@ -87,6 +95,10 @@ class TestFileFilters(unittest.TestCase):
         # Test with non-matching glob pattern
         filter2 = PatternFilter("*.pdf")
         self.assertFalse(filter2.matches(self.file_info))
+        
+        # Names are matched the same way without building a FileInfo
+        self.assertTrue(filter1.matches_name("test.txt"))
+        self.assertFalse(filter2.matches_name("test.txt"))
     
     def test_pattern_filter_regex(self):
         """Test pattern filter with regex patterns."""
@@ -228,7 +240,46 @@ class TestFileIterator(unittest.TestCase):
         # Should find all files
         files = iterator.get_files()
         self.assertEqual(len(files), 8)
-    
+
+    def test_scan_skips_unsupported_extensions(self):
+        """Test that scans skip unsupported files but descend into any directory."""
+        with open(os.path.join(self.temp_dir, "image.png"), "w") as f:
+            f.write("not a document")
+        notes_dir = os.path.join(self.temp_dir, "notes.md")
+        os.makedirs(notes_dir)
+        with open(os.path.join(notes_dir, "note.TXT"), "w") as f:
+            f.write("Nested note")
+
+        self.config.set_cli_args({
+            "source_folder": self.temp_dir,
+            "recursive": True
+        })
+
+        iterator = FileIterator(self.config)
+        names = {file_info.name for file_info in iterator.get_files()}
+        self.assertEqual(len(names), 9)
+        self.assertIn("note.TXT", names)
+        self.assertNotIn("image.png", names)
+
+    def test_scan_skips_file_removed_after_listing(self):
+        """Test that a file vanishing before its stat() only skips that file."""
+        from_direntry = FileInfo.from_direntry.__func__
+
+        def racing_from_direntry(cls, entry, extension=None):
+            if entry.name == "file1.txt":
+                raise FileNotFoundError(2, "No such file or directory", entry.path)
+            return from_direntry(cls, entry, extension)
+
+        self.config.set_cli_args({"source_folder": self.temp_dir})
+
+        with patch.object(FileInfo, "from_direntry", classmethod(racing_from_direntry)):
+            with self.assertLogs("docindexer.file_iterator", level="WARNING") as logs:
+                names = {file_info.name for file_info in FileIterator(self.config).get_files()}
+
+        self.assertNotIn("file1.txt", names)
+        self.assertIn("file2.txt", names)
+        self.assertFalse(any("Directory not found" in line for line in logs.output))
+
     def test_max_depth(self):
         """Test maximum recursion depth."""
         # Create a nested directory structure
@@ -273,6 +324,30 @@ class TestFileIterator(unittest.TestCase):
         files = iterator.get_files()
         self.assertEqual(len(files), 3)
     
+    def test_catalogue_builder_round_trip(self):
+        """Test that a saved catalogue loads back the same files."""
+        self.config.set_cli_args({
+            "source_folder": self.temp_dir,
+            "recursive": True
+        })
+        files = FileIterator(self.config).get_files()
+        
+        output_path = os.path.join(self.temp_dir, ".built_catalogue.json")
+        builder = CatalogueBuilder(output_path)
+        builder.add_files(FileIterator(self.config))
+        builder.save()
+        
+        with open(output_path) as f:
+            self.assertEqual(json.load(f), {"files": builder.files})
+        
+        self.config.set_cli_args({"catalogue": output_path})
+        self.assertEqual(FileIterator(self.config).get_files(), files)
+        
+        # An empty catalogue is still valid JSON
+        CatalogueBuilder(output_path).save()
+        with open(output_path) as f:
+            self.assertEqual(json.load(f), {"files": []})
+    
     def test_pattern_filter(self):
         """Test pattern filtering."""
         self.config.set_cli_args({
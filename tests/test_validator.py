@@ -220,7 +220,18 @@ class TestSchemaValidator(unittest.TestCase):
         self.assertEqual(len(self.validator.common_options), 5)
         self.assertEqual(len(self.validator.commands), 2)
         self.assertEqual(len(self.validator.config_sources), 3)
-    
+
+    def test_load_schema_cached(self):
+        """Test that an unchanged schema file is parsed only once."""
+        other = SchemaValidator(self.schema_file.name)
+        self.assertIs(other.schema, self.validator.schema)
+
+        # Rewriting the file must invalidate the cached schema
+        with open(self.schema_file.name, 'w') as f:
+            json.dump({"name": "edited-cli"}, f)
+        edited = SchemaValidator(self.schema_file.name)
+        self.assertEqual(edited.schema["name"], "edited-cli")
+
     def test_validate_command_success(self):
         """Test successful command validation."""
         args = {
@@ -312,7 +323,36 @@ class TestSchemaValidator(unittest.TestCase):
         self.assertEqual(with_defaults["source_folder"], "/tmp")
         self.assertEqual(with_defaults["recursive"], False)
         self.assertEqual(with_defaults["debug"], False)
-    
+
+    def test_prepare(self):
+        """Test normalizing, defaulting and validating in one call."""
+        args = {
+            "--format": "json",
+            "--source-folder": "/tmp"
+        }
+
+        prepared, errors = self.validator.prepare("process", args)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(prepared["format"], "json")
+        self.assertEqual(prepared["source_folder"], "/tmp")
+        self.assertEqual(prepared["recursive"], False)
+
+        _, errors = self.validator.prepare("process", {"--source-folder": 42})
+        self.assertTrue(any("must be a string" in e for e in errors))
+
+        # Repeated arguments are served from the cache as independent copies
+        prepared["format"] = "changed"
+        again, errors = self.validator.prepare("process", args)
+        self.assertEqual(errors, [])
+        self.assertEqual(again["format"], "json")
+
+        # Equal but differently typed values are validated separately
+        _, errors = self.validator.prepare("process", {"--format": "json", "--recursive": True})
+        self.assertEqual(errors, [])
+        _, errors = self.validator.prepare("process", {"--format": "json", "--recursive": 1})
+        self.assertTrue(any("must be a boolean" in e for e in errors))
+
     def test_get_option_by_flag(self):
         """Test finding option by flag."""
         option = self.validator.get_option_by_flag("--output")
@@ -384,6 +424,33 @@ class TestConfiguration(unittest.TestCase):
         self.assertEqual(self.config.get("local_option"), "local_value")
         self.assertEqual(self.config.get("shared_option"), "local_value")
     
+    def test_load_config_unchanged_file_reused(self):
+        """Test that unchanged config files are not re-parsed on reload."""
+        self.config.load_config()
+        local_config = self.config._local_config
+
+        # Reloading an unchanged file keeps the parsed dictionary
+        self.config.load_config()
+        self.assertIs(self.config._local_config, local_config)
+
+        # Rewriting the file picks up the new contents
+        with open(self.local_config_path, 'w') as f:
+            json.dump({"local_option": "changed_local_value"}, f)
+        self.config.load_config()
+        self.assertEqual(self.config.get("local_option"), "changed_local_value")
+
+    def test_single_source_reload_visible(self):
+        """Test that reloading one source is reflected in merged lookups."""
+        self.config.load_config()
+        self.assertEqual(self.config.get("shared_option"), "local_value")
+
+        with open(self.local_config_path, 'w') as f:
+            json.dump({"shared_option": "reloaded_value"}, f)
+        self.config.load_local_config()
+
+        self.assertEqual(self.config.get("shared_option"), "reloaded_value")
+        self.assertEqual(self.config.as_dict()["shared_option"], "reloaded_value")
+
     def test_set_cli_args(self):
         """Test setting command-line arguments."""
         self.config.load_config()
@@ -423,7 +490,25 @@ class TestConfiguration(unittest.TestCase):
         self.assertEqual(new_local_config["local_option"], "local_value")
         self.assertEqual(new_local_config["cli_option"], "cli_value")
         self.assertEqual(new_local_config["shared_option"], "cli_value")
-    
+
+    @unittest.skipIf(os.name == 'nt', "POSIX permission bits")
+    def test_created_config_file_permissions(self):
+        """Test that newly created config files are private to their owner."""
+        os.unlink(self.local_config_path)
+        self.assertTrue(self.config.create_local_config())
+
+        self.assertEqual(os.stat(self.local_config_path).st_mode & 0o777, 0o600)
+
+    def test_create_global_config_missing_directory(self):
+        """Test that the global config directory is created when missing."""
+        os.unlink(self.global_config_path)
+        os.rmdir(self.global_config_dir)
+        self.config.load_local_config()
+        self.assertTrue(self.config.create_global_config())
+
+        with open(self.global_config_path) as f:
+            self.assertEqual(json.load(f)["local_option"], "local_value")
+
     def test_missing_config_file(self):
         """Test behavior with missing config files."""
         # Make sure the files don't exist for this test